@@ -35,10 +35,6 @@ hiddenimports = [
     'serial',
     'serial.serialutil',
     'openai',
-    'fuzzywuzzy',
-    'fuzzywuzzy.fuzz',
-    'fuzzywuzzy.process',
-    'Levenshtein',
     'PIL',
     'PIL.Image',
     'PIL.ImageTk',
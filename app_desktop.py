@@ -77,10 +77,11 @@ def main():
 
     # Load language setting
     from gearledger.desktop.translations import set_current_language
-    from gearledger.speech import set_speech_language
+    from gearledger.speech import set_speech_language, warmup_speech
 
     set_current_language(settings.language)
     set_speech_language(settings.language)  # Sync speech language with UI language
+    warmup_speech()  # Load TTS in the background so the first announcement is fast
 
     app = QApplication(sys.argv)
 
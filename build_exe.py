@@ -108,8 +108,6 @@ def main():
         "--hidden-import=cv2",
         "--hidden-import=serial",
         "--hidden-import=openai",
-        "--hidden-import=fuzzywuzzy",
-        "--hidden-import=Levenshtein",
         "--hidden-import=PIL",
         "--hidden-import=multiprocessing",
         "--collect-all=PyQt6",
@@ -69,8 +69,6 @@ def main():
         "cv2": "opencv-python",
         "serial": "pyserial",
         "openai": "openai",
-        "fuzzywuzzy": "fuzzywuzzy",
-        "Levenshtein": "python-Levenshtein",
         "PIL": "Pillow",
     }
 
@@ -84,8 +82,6 @@ def main():
                 import serial
             elif import_name == "PIL":
                 from PIL import Image
-            elif import_name == "Levenshtein":
-                import Levenshtein
             else:
                 __import__(import_name)
             print(f"✅ {import_name} is installed")
@@ -159,8 +155,6 @@ def main():
         "--include-module=cv2",
         "--include-module=serial",
         "--include-module=openai",
-        "--include-module=fuzzywuzzy",
-        "--include-module=Levenshtein",
         "--include-module=PIL",
         "--include-module=multiprocessing",
         "--output-dir=dist",  # Output directory
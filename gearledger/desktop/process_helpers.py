@@ -6,6 +6,7 @@ import queue
 from typing import Dict, Any, List, Tuple
 
 from gearledger.pipeline import process_image, run_fuzzy_match
+from gearledger.logging_utils import flush_log
 from gearledger.config import (
     DEFAULT_LANGS,
     DEFAULT_MIN_FUZZY,
@@ -29,6 +30,8 @@ def _main_job(image: str, excel_catalog: str, target: str, model: str, out_q: mp
         )
     except Exception as e:
         res = {"ok": False, "error": str(e), "logs": [f"[ERROR] {e}"]}
+    # Job processes exit without running atexit hooks — flush explicitly
+    flush_log()
     out_q.put(res)
 
 
@@ -43,6 +46,8 @@ def _fuzzy_job(
         res = run_fuzzy_match(excel_catalog, cand_order, min_fuzzy)
     except Exception as e:
         res = {"ok": False, "error": str(e), "logs": [f"[ERROR] {e}"]}
+    # Job processes exit without running atexit hooks — flush explicitly
+    flush_log()
     out_q.put(res)
 
 
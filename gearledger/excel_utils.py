@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import itertools
+import json
 import os
 import pandas as pd
 
 # ---------------------------------------------------------------------------
-# Catalog cache — keyed by absolute path; invalidated when mtime changes.
-# Each entry: {"mtime": float, "lookup": dict, "lookup_nodash": dict}
+# Catalog cache — keyed by absolute path; invalidated when mtime or size
+# changes (size catches rewrites within the filesystem's mtime resolution).
+# Bounded to _CATALOG_CACHE_MAX entries, least-recently-used evicted first.
+# Each entry: {"mtime": float, "size": int, "lookup": dict, "lookup_nodash": dict}
 # lookup maps  space-normalised code  →  list of (client_str, orig_artikul_str),
 # one entry per distinct client sharing that exact code (e.g. two different
 # customers both ordering "336758J") — first-seen orig kept per client, so
@@ -20,6 +25,17 @@ import threading
 from typing import Any, Dict, List, Optional, Tuple
 _catalog_cache: dict = {}
 _catalog_lock = threading.Lock()
+_CATALOG_CACHE_MAX = 8
+
+# On-disk copy of each built catalog entry, so a fresh process (every desktop
+# job runs in its own) skips pd.read_excel while the workbook is unchanged.
+# Plain JSON, validated field by field on load; oldest files pruned past the
+# cap. Bump the version whenever the entry layout changes.
+_CATALOG_DISK_DIR = os.path.join(
+    os.path.expanduser("~"), ".gearledger", "cache", "catalogs"
+)
+_CATALOG_DISK_VERSION = 2
+_CATALOG_DISK_MAX_FILES = 16
 
 
 class ExcelReadError(Exception):
@@ -31,6 +47,20 @@ class ExcelReadError(Exception):
         super().__init__(f"Failed to read Excel file: {error_message}")
 
 
+# Single-pass character maps for _space_norm / _strip_seps (one C-level
+# str.translate instead of a chain of str.replace calls per cell).
+_SPACE_NORM_TABLE = str.maketrans(
+    {"\xa0": " ", "—": "-", "–": "-", "'": None, "’": None, "‘": None}
+)
+_STRIP_SEPS_TABLE = str.maketrans("", "", "-. :/")
+
+# Characters OCR commonly confuses, tried both ways by the fuzzy pass
+_OCR_LOOKALIKES = {
+    "O": "0", "0": "O", "I": "1", "1": "I", "S": "5", "5": "S", "B": "8", "8": "B"
+}
+_OCR_VARIANTS_MAX = 64
+
+
 def _space_norm(s) -> str:
     # Trim edges, uppercase, then normalize all dash variants to a regular
     # hyphen so em-dash / en-dash in Excel cells match user-typed hyphens.
@@ -50,22 +80,14 @@ def _space_norm(s) -> str:
     # colliding into one; _strip_seps() below provides the
     # separator-agnostic fallback that cross-matches them and feeds the
     # multi-match picker.
-    s = str(s or "").strip().upper().replace("\xa0", " ")
-    s = s.replace("—", "-").replace("–", "-")
-    return s.replace("'", "").replace("’", "").replace("‘", "")
+    return str(s or "").strip().upper().translate(_SPACE_NORM_TABLE)
 
 
 def _strip_seps(s: str) -> str:
     """Remove all separator characters (-, ., space, :, /) for fallback
     matching — matches the character set the rest of the app's artikul
     normalization (result_ledger._norm) already treats as noise."""
-    return (
-        s.replace("-", "")
-        .replace(".", "")
-        .replace(" ", "")
-        .replace(":", "")
-        .replace("/", "")
-    )
+    return s.translate(_STRIP_SEPS_TABLE)
 
 
 def _detect_columns(df):
@@ -109,6 +131,132 @@ def _detect_stock_column(df) -> Optional[str]:
     return None
 
 
+def _store_catalog(abs_path: str, entry: dict):
+    """Insert *entry* as most-recently-used, evicting the oldest beyond the cap."""
+    with _catalog_lock:
+        _catalog_cache.pop(abs_path, None)
+        _catalog_cache[abs_path] = entry
+        while len(_catalog_cache) > _CATALOG_CACHE_MAX:
+            _catalog_cache.pop(next(iter(_catalog_cache)))
+
+
+def _catalog_disk_path(abs_path: str) -> str:
+    digest = hashlib.sha1(abs_path.encode("utf-8")).hexdigest()
+    return os.path.join(_CATALOG_DISK_DIR, f"{digest}.json")
+
+
+def _pairs_from_json(obj, second_type) -> dict:
+    """{code: [[client, value], ...]} → {code: [(client, value), ...]}, checked."""
+    if not isinstance(obj, dict):
+        raise ValueError("expected an object")
+    out = {}
+    for code, rows in obj.items():
+        if not isinstance(rows, list):
+            raise ValueError("expected a list")
+        pairs = []
+        for row in rows:
+            if not (
+                isinstance(row, list)
+                and len(row) == 2
+                and isinstance(row[0], str)
+                and isinstance(row[1], second_type)
+            ):
+                raise ValueError("expected a (client, value) pair")
+            pairs.append((row[0], row[1]))
+        out[code] = pairs
+    return out
+
+
+def _catalog_entry_to_json(entry: dict) -> dict:
+    data = dict(entry)
+    # JSON objects only take string keys
+    data["demand_by_group"] = [
+        [key_nd, client_key, group]
+        for (key_nd, client_key), group in entry["demand_by_group"].items()
+    ]
+    return data
+
+
+def _catalog_entry_from_json(data: dict) -> dict:
+    demand_by_group = {}
+    for key_nd, client_key, group in data["demand_by_group"]:
+        if not (isinstance(group, dict) and isinstance(group.get("qty"), int)):
+            raise ValueError("bad demand group")
+        demand_by_group[(key_nd, client_key)] = group
+    entry = dict(data)
+    entry.update(
+        lookup=_pairs_from_json(data["lookup"], str),
+        lookup_nodash=_pairs_from_json(data["lookup_nodash"], str),
+        stock_rows=_pairs_from_json(data["stock_rows"], int),
+        demand_by_group=demand_by_group,
+    )
+    return entry
+
+
+def _load_catalog_from_disk(abs_path: str, mtime: float, size: int) -> Optional[dict]:
+    """Return the saved entry if it was built from this exact file state."""
+    try:
+        with open(_catalog_disk_path(abs_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not (
+            isinstance(data, dict)
+            and data.get("version") == _CATALOG_DISK_VERSION
+            and data.get("path") == abs_path
+            and data.get("mtime") == mtime
+            and data.get("size") == size
+        ):
+            return None
+        entry = data.get("entry")
+        if not (
+            isinstance(entry, dict)
+            and entry.get("mtime") == mtime
+            and entry.get("size") == size
+        ):
+            return None
+        return _catalog_entry_from_json(entry)
+    except Exception:
+        return None
+
+
+def _save_catalog_to_disk(abs_path: str, entry: dict):
+    data = {
+        "version": _CATALOG_DISK_VERSION,
+        "path": abs_path,
+        "mtime": entry["mtime"],
+        "size": entry["size"],
+        "entry": _catalog_entry_to_json(entry),
+    }
+    path = _catalog_disk_path(abs_path)
+    try:
+        text = json.dumps(data, ensure_ascii=False)
+        os.makedirs(_CATALOG_DISK_DIR, exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a partial file
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+        entries = [e for e in os.scandir(_CATALOG_DISK_DIR) if e.name.endswith(".json")]
+        if len(entries) > _CATALOG_DISK_MAX_FILES:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for e in entries[: len(entries) - _CATALOG_DISK_MAX_FILES]:
+                os.unlink(e.path)
+    except Exception:
+        pass
+
+
+def _clear_catalog_disk_cache():
+    try:
+        entries = list(os.scandir(_CATALOG_DISK_DIR))
+    except OSError:
+        return
+    for e in entries:
+        try:
+            os.unlink(e.path)
+        except OSError:
+            pass
+
+
 def _load_catalog(excel_path: str) -> dict:
     """
     Load Excel, build lookup dicts, cache the result.
@@ -117,15 +265,23 @@ def _load_catalog(excel_path: str) -> dict:
     """
     abs_path = os.path.abspath(excel_path)
     try:
-        mtime = os.path.getmtime(abs_path)
+        st = os.stat(abs_path)
     except OSError as e:
         raise ExcelReadError(excel_path, str(e))
+    mtime, size = st.st_mtime, st.st_size
 
     with _catalog_lock:
         cached = _catalog_cache.get(abs_path)
-        if cached and cached["mtime"] == mtime:
+        if cached and cached["mtime"] == mtime and cached.get("size") == size:
+            # Re-insert so this path becomes most-recently-used
+            _catalog_cache[abs_path] = _catalog_cache.pop(abs_path)
             return cached
 
+    entry = _load_catalog_from_disk(abs_path, mtime, size)
+    if entry is not None:
+        _store_catalog(abs_path, entry)
+        return entry
+
     # Read Excel outside the lock so we don't block other threads
     try:
         df = pd.read_excel(abs_path)
@@ -136,14 +292,14 @@ def _load_catalog(excel_path: str) -> dict:
     if not artikul_col:
         entry = {
             "mtime": mtime,
+            "size": size,
             "lookup": {},
             "lookup_nodash": {},
             "stock_rows": {},
             "demand_by_group": {},
             "error": "no_artikul_col",
         }
-        with _catalog_lock:
-            _catalog_cache[abs_path] = entry
+        _store_catalog(abs_path, entry)
         return entry
     if not client_col:
         client_col = artikul_col
@@ -170,12 +326,22 @@ def _load_catalog(excel_path: str) -> dict:
     # code still gets their own entry instead of being silently shadowed.
     _lookup_seen_clients: dict = {}
 
-    for _, row in df.iterrows():
-        orig = str(row[artikul_col] or "")
-        norm = _space_norm(orig)
+    # Pull the columns out once and normalize the artikul column in a single
+    # pass — far cheaper than df.iterrows(), which builds a Series per row.
+    origs = [str(v or "") for v in df[artikul_col].tolist()]
+    norms = [_space_norm(o) for o in origs]
+    if client_col != artikul_col:
+        clients = [str(v) for v in df[client_col].tolist()]
+    else:
+        clients = [""] * len(origs)
+    if stock_col is not None:
+        stock_vals = pd.to_numeric(df[stock_col], errors="coerce").tolist()
+    else:
+        stock_vals = [None] * len(origs)
+
+    for orig, norm, client_val, stock_val in zip(origs, norms, clients, stock_vals):
         if not norm or norm == "NAN":
             continue
-        client_val = str(row[client_col]) if client_col != artikul_col else ""
         client_key = client_val.strip().upper()
         seen_for_norm = _lookup_seen_clients.setdefault(norm, set())
         if client_key not in seen_for_norm:
@@ -187,7 +353,7 @@ def _load_catalog(excel_path: str) -> dict:
         # Stock count
         if stock_col is not None:
             try:
-                cnt = int(pd.to_numeric(row[stock_col], errors="coerce") or 0)
+                cnt = int(stock_val or 0)
             except Exception:
                 cnt = 0
             key_nd = norm_nd or norm
@@ -201,6 +367,7 @@ def _load_catalog(excel_path: str) -> dict:
 
     entry = {
         "mtime": mtime,
+        "size": size,
         "lookup": lookup,
         "lookup_nodash": lookup_nodash,
         "stock_rows": stock_rows,
@@ -211,8 +378,8 @@ def _load_catalog(excel_path: str) -> dict:
         "total_rows": len(df),
         "error": None,
     }
-    with _catalog_lock:
-        _catalog_cache[abs_path] = entry
+    _store_catalog(abs_path, entry)
+    _save_catalog_to_disk(abs_path, entry)
     return entry
 
 
@@ -276,12 +443,21 @@ def get_catalog_stock(
 
 
 def invalidate_catalog_cache(excel_path: str = None):
-    """Invalidate cached catalog. Pass None to clear everything."""
+    """
+    Invalidate cached catalog (in memory and its on-disk copy).
+    Pass None to clear everything, in memory and on disk.
+    """
     with _catalog_lock:
         if excel_path is None:
             _catalog_cache.clear()
+            _clear_catalog_disk_cache()
         else:
-            _catalog_cache.pop(os.path.abspath(excel_path), None)
+            abs_path = os.path.abspath(excel_path)
+            _catalog_cache.pop(abs_path, None)
+            try:
+                os.unlink(_catalog_disk_path(abs_path))
+            except OSError:
+                pass
 
 
 def find_all_matches_in_excel(excel_path: str, query_raw: str) -> List[Tuple[str, str]]:
@@ -391,3 +567,59 @@ def try_match_in_excel(excel_path: str, query_raw: str, *_args, **_kwargs):
 
     debug_lines.append(f"✗ No match for ‘{q}’ ({len(lookup)} entries searched)")
     return (None, None, "\n".join(debug_lines))
+
+
+def _ocr_lookalike_variants(code: str) -> List[str]:
+    """
+    Spellings of *code* with OCR look-alike characters swapped (the code
+    itself excluded), fewest swaps first, capped at _OCR_VARIANTS_MAX.
+    Every single swap comes before any double swap, so a long code can't
+    fill the cap with swaps at its last positions only.
+    """
+    spots = [i for i, ch in enumerate(code) if ch in _OCR_LOOKALIKES]
+    variants: List[str] = []
+    for n in range(1, len(spots) + 1):
+        for picked in itertools.combinations(spots, n):
+            chars = list(code)
+            for i in picked:
+                chars[i] = _OCR_LOOKALIKES[chars[i]]
+            variants.append("".join(chars))
+            if len(variants) == _OCR_VARIANTS_MAX:
+                return variants
+    return variants
+
+
+def try_match_ocr_variants(excel_path: str, query_raw: str, *_args, **_kwargs):
+    """
+    Like try_match_in_excel, but for OCR look-alike spellings of the query
+    (O/0, I/1, S/5, B/8). Each variant is a dict lookup against the cached
+    catalog, never a scan. Returns (client, artikul_display, debug).
+    """
+    if not os.path.exists(excel_path):
+        return (None, None, f"Excel not found: {excel_path}")
+
+    catalog = _load_catalog(excel_path)  # may raise ExcelReadError
+
+    if catalog.get("error") == "no_artikul_col":
+        return (None, None, "Could not locate an artikul/part-code column.")
+
+    lookup = catalog["lookup"]
+    lookup_nodash = catalog["lookup_nodash"]
+
+    q_nd = _strip_seps(_space_norm(query_raw))
+    variants = _ocr_lookalike_variants(q_nd)
+    for v in variants:
+        hits = lookup.get(v) or lookup_nodash.get(v)
+        if hits:
+            client_val, orig = hits[0]
+            return (
+                client_val,
+                orig,
+                f"✓ MATCH (OCR look-alike): ‘{q_nd}’ → ‘{v}’ → ‘{orig}’ | client: ‘{client_val}’",
+            )
+
+    return (
+        None,
+        None,
+        f"✗ No OCR look-alike match for ‘{q_nd}’ ({len(variants)} variants tried)",
+    )
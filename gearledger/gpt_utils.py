@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import base64, json, io
+import base64, json
 from typing import List, Tuple, Optional
-from PIL import Image, ImageOps
+from .image_utils import encode_jpeg_rgb, load_rgb_downscaled
+
+# Optional: faster JSON encode/decode for prompts and model answers
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 # ---- simple price table you already had ----
 PRICES = {
@@ -19,9 +25,31 @@ def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> flo
     ]
 
 
+# Output cap for the text-ranking call: the answer is one short JSON
+# object, and decoding time grows with every output token
+_TEXT_RANK_MAX_TOKENS = 200
+
+# JSON mode: the API guarantees a single valid JSON object back
+_JSON_OBJECT = {"type": "json_object"}
+
+
 # ---------- structured JSON helpers ----------
+def _json_dumps(obj) -> str:
+    # Compact and UTF-8 either way (Cyrillic stays readable, fewer tokens)
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_loads(s: str):
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
 def build_prompt(candidates, target="auto"):
-    payload = [{"text": t, "confidence": round(float(c), 4)} for (t, c) in candidates]
+    # Short keys: every key is repeated per candidate in the prompt
+    payload = [{"t": t, "c": round(float(c), 2)} for (t, c) in candidates]
     if target == "vendor":
         goal = (
             "Choose the VENDOR article number (e.g., 'PK-5396'). "
@@ -42,12 +70,12 @@ def build_prompt(candidates, target="auto"):
         "You are an assistant that selects a car-part identifier from OCR text.\n"
         f"{goal}\n"
         "Ignore dates, quantities, barcodes, and generic words.\n"
-        "Return ONLY compact JSON (no code fences): "
-        '{"best":"<original>","normalized":"<uppercase_no_spaces_dashes>","reason":"<short>","ranked":[...]}'
+        "Return ONLY compact JSON: "
+        '{"best":"<original>","normalized":"<uppercase_no_spaces_dashes>","reason":"<short>"}'
     )
     usr = (
-        "Candidates (JSON array):\n"
-        + json.dumps(payload, ensure_ascii=False)
+        "Candidates (JSON array; t = OCR text, c = OCR confidence):\n"
+        + _json_dumps(payload)
         + "\n\nChoose the best."
     )
     return sys, usr
@@ -61,7 +89,7 @@ def parse_compact_json(s: str):
     end = s.rfind("}")
     if start != -1 and end != -1 and end > start:
         s = s[start : end + 1]
-    return json.loads(s)
+    return _json_loads(s)
 
 
 # ---------- OpenAI client helpers ----------
@@ -85,7 +113,8 @@ def rank_with_gpt(client, model: str, filtered_pairs, target: str, top_k: int =
         model=model,
         temperature=0.0,
         messages=[{"role": "system", "content": sys}, {"role": "user", "content": usr}],
-        max_tokens=300,
+        response_format=_JSON_OBJECT,
+        max_tokens=_TEXT_RANK_MAX_TOKENS,
     )
     raw = (resp.choices[0].message.content or "").strip()
     u = getattr(resp, "usage", None) or {}
@@ -101,16 +130,9 @@ def _encode_image_to_data_url(path: str, max_side: int = 1280) -> str:
     """
     EXIF-rotate + downscale to max_side + JPEG encode + base64 → data URL.
     """
-    with Image.open(path) as im:
-        im = ImageOps.exif_transpose(im)
-        w, h = im.size
-        scale = float(max_side) / float(max(w, h))
-        if scale < 1.0:
-            im = im.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
-        buf = io.BytesIO()
-        im.convert("RGB").save(buf, format="JPEG", quality=90)
-        b64 = base64.b64encode(buf.getvalue()).decode("ascii")
-        return f"data:image/jpeg;base64,{b64}"
+    img = load_rgb_downscaled(path, max_side)
+    b64 = base64.b64encode(encode_jpeg_rgb(img, 90)).decode("ascii")
+    return f"data:image/jpeg;base64,{b64}"
 
 
 def rank_with_gpt_vision(
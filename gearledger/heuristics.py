@@ -1,51 +1,79 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 import re
-from typing import Optional, Set, List
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Optional, Set
 from .logging_utils import info, warn, err, step
 
 
+# ---------------- Precompiled patterns ----------------
+# Hoisted to module level: these predicates run several times per OCR token.
+
+# Separators dropped by normalize_code (str.translate: one C-level pass)
+_NORMALIZE_TABLE = str.maketrans("", "", " \t\n\r-.:/")
+_UPPER_RE = re.compile(r"[A-Z]")
+_DIGIT_RE = re.compile(r"\d", re.ASCII)
+_WORD_ONLY_RE = re.compile(r"[A-Z]+")
+_PURE_DIGITS_RE = re.compile(r"\d+", re.ASCII)
+_BARCODE_SEP_RE = re.compile(r"[ /]")
+_DATE_RE = re.compile(
+    r"\b(?:\d{1,2}[./-]\d{1,2}[./-]\d{2,4}|\d{4}[./-]\d{1,2}[./-]\d{1,2})(?:\s*\d{1,2}:\d{2})?\b"
+)
+_TIME_RE = re.compile(r"\b\d{1,2}:\d{2}\b")
+_DIGITS_PLUS_WORD_RE = re.compile(r"\b\d{3,}\s+[A-Za-z]{3,}\b")
+_VENDOR_RE = re.compile(r"[A-Za-z]{2,4}[- ]?\d{3,6}[A-Za-z0-3]{0,2}", re.ASCII)
+_OEM_GROUPED_RE = re.compile(
+    r"[A-Za-z]?\d{2,3}[- ]\d{2,3}[- ]\d{2,4}([ -]\d{2,4})?", re.ASCII
+)
+_CHUNK_SPLIT_RE = re.compile(r"[\s\-/_.]+")
+
+# Character sets for "contains any / consists only of" tests — a frozenset
+# membership check per character instead of a regex engine call
+_ASCII_LETTERS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+_ALNUM_CHARS = _ASCII_LETTERS | frozenset("0123456789")
+_CODE_CHARS = _ALNUM_CHARS | frozenset("-./")
+_NO_CONTEXT: frozenset = frozenset()
+_LETTER_THEN_DIGIT_RE = re.compile(r"[A-Za-z].*\d", re.ASCII)
+_DIGIT_THEN_LETTER_RE = re.compile(r"\d.*[A-Za-z]", re.ASCII)
+
+
 # ---------------- Basic helpers ----------------
 
 
 def normalize_code(s: str) -> str:
     """Uppercase and remove whitespace, dashes, dots, slashes, and colons."""
-    return re.sub(r"[ \t\n\r\-.:/]", "", s or "").upper()
+    return (s or "").translate(_NORMALIZE_TABLE).upper()
 
 
 def has_letters_and_digits(s: str) -> bool:
-    return bool(re.search(r"[A-Z]", s)) and bool(re.search(r"\d", s))
+    return bool(_UPPER_RE.search(s)) and bool(_DIGIT_RE.search(s))
 
 
 def is_word_only(s: str) -> bool:
-    return bool(re.fullmatch(r"[A-Z]+", s or ""))
+    return bool(_WORD_ONLY_RE.fullmatch(s or ""))
 
 
 def is_pure_digits(s: str) -> bool:
-    return bool(re.fullmatch(r"\d+", s or ""))
+    return bool(_PURE_DIGITS_RE.fullmatch(s or ""))
 
 
 def is_barcode_like(raw: str) -> bool:
-    t = re.sub(r"[ /]", "", raw or "")
+    t = _BARCODE_SEP_RE.sub("", raw or "")
     return is_pure_digits(t) and len(t) >= 7
 
 
 def is_date_like(raw: str) -> bool:
-    return bool(
-        re.search(
-            r"\b(?:\d{1,2}[./-]\d{1,2}[./-]\d{2,4}|\d{4}[./-]\d{1,2}[./-]\d{1,2})(?:\s*\d{1,2}:\d{2})?\b",
-            raw or "",
-        )
-    )
+    return bool(_DATE_RE.search(raw or ""))
 
 
 def is_time_like(raw: str) -> bool:
-    return bool(re.search(r"\b\d{1,2}:\d{2}\b", raw or ""))
+    return bool(_TIME_RE.search(raw or ""))
 
 
 def is_digits_plus_word(raw: str) -> bool:
     # e.g., "641678568 Miqo"
-    return bool(re.search(r"\b\d{3,}\s+[A-Za-z]{3,}\b", raw or ""))
+    return bool(_DIGITS_PLUS_WORD_RE.search(raw or ""))
 
 
 # ---------------- Vendor / OEM recognizers ----------------
@@ -61,7 +89,7 @@ def is_vendor_like(raw: str) -> bool:
     if not raw:
         return False
     txt = raw.strip()
-    if re.fullmatch(r"[A-Za-z]{2,4}[- ]?\d{3,6}[A-Za-z0-3]{0,2}", txt):
+    if _VENDOR_RE.fullmatch(txt):
         return True
     if _VENDOR_O450.fullmatch(txt):
         return True
@@ -75,14 +103,13 @@ def is_oem_like(raw: str) -> bool:
     if not raw:
         return False
     n = normalize_code(raw)
-    if len(n) >= 8 and has_letters_and_digits(n):
+    return _oem_like(raw, n, has_letters_and_digits(n))
+
+
+def _oem_like(raw: str, n: str, has_ld: bool) -> bool:
+    if len(n) >= 8 and has_ld:
         return True
-    return bool(
-        re.fullmatch(
-            r"[A-Za-z]?\d{2,3}[- ]\d{2,3}[- ]\d{2,4}([ -]\d{2,4})?",
-            raw.strip(),
-        )
-    )
+    return bool(_OEM_GROUPED_RE.fullmatch(raw.strip()))
 
 
 def is_two_long_chunks(raw: str) -> bool:
@@ -91,11 +118,11 @@ def is_two_long_chunks(raw: str) -> bool:
     """
     if not raw:
         return False
-    chunks = re.split(r"[\s\-/_.]+", raw.strip())
+    chunks = _CHUNK_SPLIT_RE.split(raw.strip())
     longish = [
         c
         for c in chunks
-        if len(normalize_code(c)) >= 6 and re.search(r"[A-Za-z0-9]", c)
+        if len(normalize_code(c)) >= 6 and not _ALNUM_CHARS.isdisjoint(c)
     ]
     return len(longish) >= 2
 
@@ -103,6 +130,45 @@ def is_two_long_chunks(raw: str) -> bool:
 # ---------------- Filter + scoring ----------------
 
 
+@dataclass
+class Cand:
+    """
+    One OCR token with its heuristic flags computed lazily, at most once.
+    Filtering and scoring the same Cand share every regex result.
+    """
+
+    raw: str
+    conf: float = 0.0
+
+    @cached_property
+    def norm(self) -> str:
+        return normalize_code(self.raw)
+
+    @cached_property
+    def has_ld(self) -> bool:
+        return has_letters_and_digits(self.norm)
+
+    @cached_property
+    def is_vendor(self) -> bool:
+        return is_vendor_like(self.raw)
+
+    @cached_property
+    def is_oem(self) -> bool:
+        return bool(self.raw) and _oem_like(self.raw, self.norm, self.has_ld)
+
+    @cached_property
+    def is_date_or_time(self) -> bool:
+        return is_date_like(self.raw) or is_time_like(self.raw)
+
+    @cached_property
+    def is_barcode(self) -> bool:
+        return is_barcode_like(self.raw)
+
+    @cached_property
+    def is_digits_word(self) -> bool:
+        return is_digits_plus_word(self.raw)
+
+
 def looks_like_part(
     raw: str,
     target: str = "auto",
@@ -111,43 +177,40 @@ def looks_like_part(
     """
     Quick pre-filter: decide if a token is worth considering as a part code.
     """
-    logs: List[str] = []
+    if not raw:
+        return False
+    return cand_looks_like_part(Cand(raw), target)
 
-    def log(fn, msg):
-        fn(msg)
-        logs.append(msg)
 
+def cand_looks_like_part(c: Cand, target: str = "auto") -> bool:
+    """looks_like_part() on a prebuilt Cand, reusing its cached flags."""
+    raw = c.raw
     if not raw:
         return False
 
-    n = normalize_code(raw)
     if is_pure_digits(raw):  # <- NEW: drop pure numbers like "0006"
-        log(info, f"Dropping pure numbers like {raw}")
+        info(f"Dropping pure numbers like {raw}")
         return False
-    if is_date_like(raw) or is_time_like(raw):
-        log(info, f"Dropping date or time like {raw}")
+    if c.is_date_or_time:
+        info(f"Dropping date or time like {raw}")
         return False
-    if is_barcode_like(raw):
-        log(info, f"Dropping barcode like {raw}")
+    if c.is_barcode:
+        info(f"Dropping barcode like {raw}")
         return False
-    if is_word_only(n):
-        log(info, f"Dropping word only like {raw}")
+    if is_word_only(c.norm):
+        info(f"Dropping word only like {raw}")
         return False  # single word like BRAND, COUNTRY
-    if is_digits_plus_word(raw):
-        log(info, f"Dropping digits plus word like {raw}")
+    if c.is_digits_word:
+        info(f"Dropping digits plus word like {raw}")
         return False  # "1234 WORD" noise
 
     if target == "vendor":
-        return is_vendor_like(raw) or (has_letters_and_digits(n) and len(n) >= 5)
+        return c.is_vendor or (c.has_ld and len(c.norm) >= 5)
     if target == "oem":
-        return is_oem_like(raw)
+        return c.is_oem
 
     # auto → accept either vendor-like or OEM-like or any long-ish alnum
-    return (
-        is_vendor_like(raw)
-        or is_oem_like(raw)
-        or (has_letters_and_digits(n) and len(n) >= 8)
-    )
+    return c.is_vendor or c.is_oem or (c.has_ld and len(c.norm) >= 8)
 
 
 def score_candidate(
@@ -160,11 +223,19 @@ def score_candidate(
     Assign a numeric score to a token. Higher is better.
     Signature matches how pipeline calls it: (target, oem_context, raw, conf).
     """
-    n = normalize_code(raw or "")
+    return cand_score(Cand(raw or "", conf), target, oem_context)
+
+
+def cand_score(
+    c: Cand, target: str = "auto", oem_context: Optional[Set[str]] = None
+) -> float:
+    """score_candidate() on a prebuilt Cand, reusing its cached flags."""
+    raw = c.raw or ""
+    n = c.norm
     score = 0.0
 
     # base positives
-    if has_letters_and_digits(n):
+    if c.has_ld:
         score += 6
     if n and n[0].isalpha():
         score += 2
@@ -172,24 +243,24 @@ def score_candidate(
         score += 2
     if len(n) >= 11:
         score += 1
-    if " " not in (raw or "") and re.fullmatch(r"[A-Za-z0-9\-./]+", raw or ""):
+    if raw and _CODE_CHARS.issuperset(raw):
         score += 1.5
-    if re.search(r"[A-Za-z].*\d", n) and re.search(r"\d.*[A-Za-z]", n):
+    if _LETTER_THEN_DIGIT_RE.search(n) and _DIGIT_THEN_LETTER_RE.search(n):
         score += 2
 
     # target-specific boosts/penalties
-    ctx = oem_context or set()
+    ctx = oem_context or _NO_CONTEXT
     if target == "vendor":
-        if is_vendor_like(raw):
+        if c.is_vendor:
             score += 6
-        if is_oem_like(raw):
+        if c.is_oem:
             score -= 4
         if raw in ctx:
             score -= 3
     elif target == "oem":
-        if is_oem_like(raw):
+        if c.is_oem:
             score += 6
-        if is_vendor_like(raw):
+        if c.is_vendor:
             score -= 3
         if raw in ctx:
             score += 2
@@ -197,19 +268,19 @@ def score_candidate(
     # general negatives
     if is_pure_digits(n):
         score -= 12  # stronger penalty so "0006" can’t win as fallback
-    if "/" in (raw or "") and not re.search(r"[A-Za-z]", raw or ""):
+    if "/" in raw and _ASCII_LETTERS.isdisjoint(raw):
         score -= 4
-    if is_date_like(raw) or is_time_like(raw):
+    if c.is_date_or_time:
         score -= 10
-    if is_digits_plus_word(raw):
+    if c.is_digits_word:
         score -= 6
     if is_two_long_chunks(raw):
         score -= 4  # suppress junk like two long alnum chunks
 
     # OCR confidence
     try:
-        c = float(conf)
+        conf = float(c.conf)
     except Exception:
-        c = 0.0
-    score += max(0.0, min(c, 1.0)) * 1.5
+        conf = 0.0
+    score += max(0.0, min(conf, 1.0)) * 1.5
     return score
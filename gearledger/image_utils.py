@@ -1,8 +1,9 @@
 # gearledger/image_utils.py
 # -*- coding: utf-8 -*-
-import tempfile
-from PIL import Image, ImageOps
-from .logging_utils import step, info
+import io
+import numpy as np
+from PIL import Image
+from .logging_utils import info
 
 # Optional HEIC/HEIF support (no error if not installed)
 try:
@@ -12,6 +13,13 @@ try:
 except Exception:
     pass
 
+# OpenCV is optional here: INTER_AREA is both faster and better than LANCZOS
+# for large downscales, but PIL is kept as the fallback
+try:
+    import cv2
+except Exception:
+    cv2 = None
+
 
 def _coerce_max_side(x, default=1280) -> int:
     """Ensure max_side is an int even if a list/tuple/string sneaks in."""
@@ -23,25 +31,123 @@ def _coerce_max_side(x, default=1280) -> int:
         return int(default)
 
 
-def prepare_image_safe(path: str, max_side=1280) -> str:
+def _resize_array(img: np.ndarray, new_size) -> np.ndarray:
+    if cv2 is not None:
+        return cv2.resize(img, new_size, interpolation=cv2.INTER_AREA)
+    return np.asarray(Image.fromarray(img).resize(new_size, Image.LANCZOS))
+
+
+def _draft_jpeg(im, max_side: int) -> None:
     """
-    EXIF-rotate + optional downscale + save to temp JPEG.
-    Returns path to temp file (must be cleaned by caller if desired).
+    For JPEGs, let libjpeg decode straight to 1/2, 1/4 or 1/8 scale (in the
+    DCT domain) as long as both sides stay >= max_side — far less IDCT work
+    than a full decode; INTER_AREA then does the exact downscale.
     """
-    max_side = _coerce_max_side(max_side)
+    if im.format == "JPEG":
+        im.draft("RGB", (max_side, max_side))
+
+
+def encode_jpeg_rgb(img: np.ndarray, quality: int = 92) -> bytes:
+    """JPEG-encode an RGB ndarray (OpenCV's encoder when available)."""
+    if cv2 is not None:
+        ok, buf = cv2.imencode(
+            ".jpg",
+            cv2.cvtColor(img, cv2.COLOR_RGB2BGR),
+            [cv2.IMWRITE_JPEG_QUALITY, int(quality)],
+        )
+        if ok:
+            return buf.tobytes()
+    out = io.BytesIO()
+    Image.fromarray(img).save(out, format="JPEG", quality=int(quality))
+    return out.getvalue()
+
+
+def _exif_orientation(im) -> int:
+    try:
+        return int(im.getexif().get(0x0112, 1))
+    except Exception:
+        return 1
+
 
+def _apply_orientation(img: np.ndarray, orientation: int) -> np.ndarray:
+    """Same result as ImageOps.exif_transpose, as numpy views (no PIL round trip)."""
+    if orientation == 2:
+        img = img[:, ::-1]
+    elif orientation == 3:
+        img = img[::-1, ::-1]
+    elif orientation == 4:
+        img = img[::-1]
+    elif orientation == 5:
+        img = img.transpose(1, 0, 2)
+    elif orientation == 6:
+        img = np.rot90(img, k=-1)
+    elif orientation == 7:
+        img = img[::-1, ::-1].transpose(1, 0, 2)
+    elif orientation == 8:
+        img = np.rot90(img, k=1)
+    else:
+        return img
+    return np.ascontiguousarray(img)
+
+
+def _decode_rgb(path: str, max_side: int, log: bool = False) -> np.ndarray:
+    """
+    Decode -> downscale -> orient, as an RGB ndarray. Rotating after the
+    resize means the orientation copy touches the small image only, and
+    there is no separate full-size exif_transpose pass.
+    """
     with Image.open(path) as im:
-        im = ImageOps.exif_transpose(im)
-        w, h = im.size
-        info(f"Original image size: {w}x{h}")
-        if max(w, h) > max_side:
-            scale = max_side / float(max(w, h))
-            new_size = (int(w * scale), int(h * scale))
-            im = im.resize(new_size, Image.LANCZOS)
-            info(f"Downscaled to: {im.size[0]}x{im.size[1]} (scale {scale:.3f})")
-        else:
-            info("Downscale not needed.")
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-        im.convert("RGB").save(tmp.name, quality=92)
-        step(f"Prepared image saved to temp: {tmp.name}")
-        return tmp.name
+        if log:
+            info(f"Original image size: {im.size[0]}x{im.size[1]}")
+        orientation = _exif_orientation(im)
+        _draft_jpeg(im, max_side)
+        img = np.asarray(im.convert("RGB"))
+    h, w = img.shape[:2]
+    if max(w, h) > max_side:
+        # Rotation by 90° swaps the sides but not the longest one
+        scale = max_side / float(max(w, h))
+        img = _resize_array(img, (int(w * scale), int(h * scale)))
+        if log:
+            info(
+                f"Downscaled to: {img.shape[1]}x{img.shape[0]} "
+                f"(scale {scale:.3f})"
+            )
+    elif log:
+        info("Downscale not needed.")
+    return _apply_orientation(img, orientation)
+
+
+def load_rgb_downscaled(path: str, max_side=1280) -> np.ndarray:
+    """EXIF-rotated RGB ndarray of *path*, downscaled (INTER_AREA) to *max_side*."""
+    return _decode_rgb(path, _coerce_max_side(max_side))
+
+
+def prepare_image_array(path: str, max_side=1280) -> np.ndarray:
+    """
+    EXIF-rotate + optional downscale, kept in memory.
+    Returns a BGR ndarray that PaddleOCR takes directly — no temp JPEG.
+    """
+    max_side = _coerce_max_side(max_side)
+
+    if cv2 is not None:
+        with Image.open(path) as im:  # header only
+            is_jpeg = im.format == "JPEG"
+        if not is_jpeg:
+            # cv2.imread applies the EXIF orientation itself
+            img = cv2.imread(path, cv2.IMREAD_COLOR)
+            if img is not None:
+                h, w = img.shape[:2]
+                info(f"Original image size: {w}x{h}")
+                if max(w, h) > max_side:
+                    scale = max_side / float(max(w, h))
+                    img = _resize_array(img, (int(w * scale), int(h * scale)))
+                    info(
+                        f"Downscaled to: {img.shape[1]}x{img.shape[0]} "
+                        f"(scale {scale:.3f})"
+                    )
+                else:
+                    info("Downscale not needed.")
+                return img
+
+    # JPEG (reduced-scale decode via draft()), HEIC/HEIF, or no OpenCV
+    return np.ascontiguousarray(_decode_rgb(path, max_side, log=True)[:, :, ::-1])
@@ -3,7 +3,13 @@
 Logging setup for Gear Ledger.
 
 Writes to ~/.gear-ledger/logs/app.log with rotation (1 MB × 3 files).
-Console prints are kept unchanged throughout the codebase.
+Console output from step/info/warn/err is buffered: info lines are
+collected and written in one go at the next step/warn/err (a stage
+boundary), when the buffer fills, on flush_log(), or at exit.
+
+The helpers take %-style args (info("x=%s", x)) and only format when the
+line will actually be written. debug() lines reach the console only with
+GEARLEDGER_LOG_LEVEL=DEBUG (or set_console_level); the file log keeps them.
 
 Usage:
     # Once at startup (app_desktop.py):
@@ -18,9 +24,12 @@ Usage:
 """
 from __future__ import annotations
 
+import atexit
 import logging
 import logging.handlers
 import os
+import sys
+import threading
 from pathlib import Path
 
 _LOG_DIR = Path.home() / ".gear-ledger" / "logs"
@@ -30,6 +39,17 @@ _LOG_FILE = _LOG_DIR / "app.log"
 _logger = logging.getLogger("gearledger")
 _initialized = False
 
+# Minimum level printed to the console
+_console_level = logging.INFO
+_env_level = logging.getLevelName(os.getenv("GEARLEDGER_LOG_LEVEL", "").upper())
+if isinstance(_env_level, int):
+    _console_level = _env_level
+
+# Pending console lines (one write + flush per batch instead of per line)
+_console_buf: list = []
+_console_lock = threading.Lock()
+_CONSOLE_BUF_MAX = 64
+
 
 def setup_logging(level: int = logging.DEBUG) -> None:
     """
@@ -94,21 +114,68 @@ def get_log_path() -> str:
 # Convenience wrappers (keep existing call sites working, now also log to file)
 # ---------------------------------------------------------------------------
 
-def step(msg: str) -> None:
-    print(f"[STEP] {msg}")
-    _logger.info("[STEP] %s", msg)
+def _flush_locked() -> None:
+    if not _console_buf:
+        return
+    text = "\n".join(_console_buf) + "\n"
+    _console_buf.clear()
+    try:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    except Exception:
+        pass
+
+
+def _emit(line: str, flush: bool) -> None:
+    with _console_lock:
+        _console_buf.append(line)
+        if flush or len(_console_buf) >= _CONSOLE_BUF_MAX:
+            _flush_locked()
+
+
+def flush_log() -> None:
+    """Write any buffered console lines now."""
+    with _console_lock:
+        _flush_locked()
+
+
+atexit.register(flush_log)
+
+
+def set_console_level(level: int) -> None:
+    """Change the minimum level step/info/debug/warn/err print to the console."""
+    global _console_level
+    _console_level = level
+
+
+def _log_at(level: int, tag: str, msg: str, args: tuple, flush: bool) -> None:
+    to_console = level >= _console_level
+    to_file = _logger.isEnabledFor(level)
+    if not (to_console or to_file):
+        return  # filtered everywhere: never format
+    if args:
+        msg = msg % args
+    if to_console:
+        _emit(f"{tag} {msg}", flush)
+    if to_file:
+        _logger.log(level, "[STEP] %s" if tag == "[STEP]" else "%s", msg)
+
+
+def step(msg: str, *args) -> None:
+    _log_at(logging.INFO, "[STEP]", msg, args, True)
+
+
+def info(msg: str, *args) -> None:
+    _log_at(logging.INFO, "[INFO]", msg, args, False)
 
 
-def info(msg: str) -> None:
-    print(f"[INFO] {msg}")
-    _logger.info("%s", msg)
+def debug(msg: str, *args) -> None:
+    _log_at(logging.DEBUG, "[DEBUG]", msg, args, False)
 
 
-def warn(msg: str) -> None:
-    print(f"[WARN] {msg}")
-    _logger.warning("%s", msg)
+def warn(msg: str, *args) -> None:
+    _log_at(logging.WARNING, "[WARN]", msg, args, True)
 
 
-def err(msg: str) -> None:
-    print(f"[ERROR] {msg}")
-    _logger.error("%s", msg)
+def err(msg: str, *args) -> None:
+    _log_at(logging.ERROR, "[ERROR]", msg, args, True)
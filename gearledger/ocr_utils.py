@@ -1,92 +1,278 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import json
 import os
-import re
-from typing import List, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import numpy as np
 from paddleocr import PaddleOCR
-from .logging_utils import step, info, warn
-from .image_utils import prepare_image_safe
+from .logging_utils import step, info, debug, warn
+from .image_utils import prepare_image_array
+from .heuristics import is_oem_like, is_vendor_like
 
 Pairs = List[Tuple[str, float]]
 
+# A token this confident that already looks like a part code makes the
+# remaining language passes redundant (auto/vendor targets only)
+_EARLY_EXIT_CONF = 0.90
+
+# On-disk OCR results keyed by image content + OCR settings; re-running the
+# same photo skips OCR entirely. Oldest entries pruned past the cap.
+_OCR_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".gearledger", "cache", "ocr")
+_OCR_CACHE_MAX_FILES = 500
+
+# Separators ignored when deduplicating OCR tokens across engines
+_DEDUP_SEP_TABLE = str.maketrans("", "", " .-")
+
+# Loaded engines, reused for the life of the process (model load is the
+# expensive part of PaddleOCR — never pay it twice for the same language)
+_ENGINE_CACHE: dict = {}
+_engine_lock = threading.Lock()
+
+# id(engine) → Event set once its warm-up inference has finished. The first
+# predict() pays graph build/kernel setup; doing it on a dummy image in the
+# background overlaps that with image preparation. Predictors aren't safe to
+# call concurrently, so real OCR waits for the event first.
+_WARMUP_DONE: dict = {}
+
+# Shared pool for running several engines on the same image at once; created
+# on first use and reused for every image after that
+_ENGINE_POOL: Optional[ThreadPoolExecutor] = None
+_ENGINE_POOL_WORKERS = 4
+
 
 def init_ocr_engines(lang_list):
-    engines = []
-    for lang in lang_list:
-        step(f"Initializing PaddleOCR engine (lang={lang}) ...")
+    with _engine_lock:
+        missing = [
+            lang for lang in dict.fromkeys(lang_list) if lang not in _ENGINE_CACHE
+        ]
+        if missing:
+            # Model loading is mostly native code that releases the GIL, so
+            # loading the languages side by side takes max(), not sum(). The
+            # first engine is built alone: on a cold model cache it downloads
+            # the sub-models every language shares (detection, orientation),
+            # and the others must not race it writing the same files.
+            for lang in missing:
+                step(f"Initializing PaddleOCR engine (lang={lang}) ...")
+            with ThreadPoolExecutor(max_workers=len(missing)) as ex:
+                futures = {missing[0]: ex.submit(PaddleOCR, lang=missing[0])}
+                wait(futures.values())
+                for lang in missing[1:]:
+                    futures[lang] = ex.submit(PaddleOCR, lang=lang)
+            for lang in missing:
+                try:
+                    engine = futures[lang].result()
+                except Exception as e:
+                    warn(f"Could not init OCR for lang={lang}: {e}")
+                    continue
+                _ENGINE_CACHE[lang] = engine
+                _start_warmup(engine, lang)
+                step(f"PaddleOCR ready for lang={lang}.")
+        return [
+            (lang, _ENGINE_CACHE[lang]) for lang in lang_list if lang in _ENGINE_CACHE
+        ]
+
+
+def _start_warmup(engine, lang):
+    done = _WARMUP_DONE[id(engine)] = threading.Event()
+
+    def run():
         try:
-            engines.append((lang, PaddleOCR(lang=lang)))
-            step(f"PaddleOCR ready for lang={lang}.")
+            engine.predict(np.zeros((32, 32, 3), dtype=np.uint8))
         except Exception as e:
-            warn(f"Could not init OCR for lang={lang}: {e}")
-    return engines
+            warn(f"[{lang}] OCR warm-up failed (harmless): {e}")
+        finally:
+            done.set()
+
+    threading.Thread(target=run, name=f"ocr-warmup-{lang}", daemon=True).start()
 
 
-def _run_engine_any(engine, safe_path, lang_tag) -> Pairs:
+def _run_engine_any(engine, image, lang_tag) -> Pairs:
     pairs: Pairs = []
+    prefix = f"[{lang_tag}]"
+    warm = _WARMUP_DONE.get(id(engine))
+    if warm is not None:
+        warm.wait()
     try:
-        page_list = engine.predict(safe_path)
+        page_list = engine.predict(image)
         if not page_list:
-            warn(f"[{lang_tag}] empty OCR result from predict().")
+            warn(f"{prefix} empty OCR result from predict().")
             return pairs
         page = page_list[0]
         if isinstance(page, dict) and "rec_texts" in page and "rec_scores" in page:
             texts, scores = page["rec_texts"], page["rec_scores"]
-            info(f"[{lang_tag}] predict() pipeline → {len(texts)} items")
+            info(f"{prefix} predict() pipeline → {len(texts)} items")
             for t, s in zip(texts, scores):
-                info(f"  [{lang_tag}] {t}  (conf {float(s):.2f})")
+                # %.2f formats numpy scalars as-is, and only if debug is enabled
+                debug("  %s %s  (conf %.2f)", prefix, t, s)
                 pairs.append((t, float(s)))
         elif isinstance(page, list):
-            info(f"[{lang_tag}] predict() classic → {len(page)} items")
+            info(f"{prefix} predict() classic → {len(page)} items")
             for i, line in enumerate(page):
                 try:
-                    text, score = line[1][0], float(line[1][1])
-                    info(f"  [{lang_tag}] {text}  (conf {score:.2f})")
-                    pairs.append((text, score))
+                    text, score = line[1][0], line[1][1]
+                    debug("  %s %s  (conf %.2f)", prefix, text, score)
+                    pairs.append((text, float(score)))
                 except Exception as e:
-                    warn(f"  [{lang_tag}] parse line {i} failed: {e}")
+                    warn(f"  {prefix} parse line {i} failed: {e}")
         else:
-            warn(f"[{lang_tag}] predict() unrecognized; trying ocr().")
+            warn(f"{prefix} predict() unrecognized; trying ocr().")
             raise TypeError("predict_format")
         return pairs
     except TypeError:
-        info(f"[{lang_tag}] falling back to ocr(..., cls=False)")
-        page = engine.ocr(safe_path, cls=False)
+        info(f"{prefix} falling back to ocr(..., cls=False)")
+        page = engine.ocr(image, cls=False)
         if not page:
-            warn(f"[{lang_tag}] empty OCR result from ocr().")
+            warn(f"{prefix} empty OCR result from ocr().")
             return pairs
         page = page[0] if isinstance(page[0], list) else page
-        info(f"[{lang_tag}] ocr() classic → {len(page)} items")
+        info(f"{prefix} ocr() classic → {len(page)} items")
         for i, line in enumerate(page):
             try:
-                text, score = line[1][0], float(line[1][1])
-                info(f"  [{lang_tag}] {text}  (conf {score:.2f})")
-                pairs.append((text, score))
+                text, score = line[1][0], line[1][1]
+                debug("  %s %s  (conf %.2f)", prefix, text, score)
+                pairs.append((text, float(score)))
             except Exception as e:
-                warn(f"  [{lang_tag}] parse line {i} failed: {e}")
+                warn(f"  {prefix} parse line {i} failed: {e}")
         return pairs
 
 
-def ocr_extract_pairs_multi(image_path: str, ocr_engines, max_side: int) -> Pairs:
-    safe_path = prepare_image_safe(image_path, max_side)
-    all_pairs: Pairs = []
+def _engine_pool() -> ThreadPoolExecutor:
+    global _ENGINE_POOL
+    with _engine_lock:
+        if _ENGINE_POOL is None:
+            _ENGINE_POOL = ThreadPoolExecutor(
+                max_workers=_ENGINE_POOL_WORKERS, thread_name_prefix="ocr-engine"
+            )
+        return _ENGINE_POOL
+
+
+def _has_strong_code(pairs: Pairs) -> bool:
+    return any(
+        s >= _EARLY_EXIT_CONF and (is_vendor_like(t) or is_oem_like(t))
+        for t, s in pairs
+    )
+
+
+@lru_cache(maxsize=8)
+def _file_sha256(path: str, mtime_ns: int, size: int) -> str:
+    # mtime/size are part of the cache key: an edited file is hashed again
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _ocr_cache_key(image_path: str, langs, max_side: int, target: str) -> str:
+    st = os.stat(image_path)
+    digest = _file_sha256(image_path, st.st_mtime_ns, st.st_size)
+    # Language order is kept: the early exit depends on which runs first
+    settings = f"{digest}|{','.join(langs)}|{max_side}|{target}"
+    return hashlib.sha256(settings.encode("utf-8")).hexdigest()
+
+
+def _load_cached_pairs(key: str) -> Optional[Pairs]:
+    path = os.path.join(_OCR_CACHE_DIR, f"{key}.json")
     try:
-        for lang, engine in ocr_engines:
-            step(f"OCR with lang={lang} on {safe_path}")
-            all_pairs.extend(_run_engine_any(engine, safe_path, lang))
-    finally:
-        try:
-            os.unlink(safe_path)
-        except Exception:
-            pass
+        with open(path, "r", encoding="utf-8") as f:
+            pairs = [(str(t), float(s)) for t, s in json.load(f)]
+        os.utime(path)  # mark as recently used
+        return pairs
+    except Exception:
+        return None
+
+
+def _save_cached_pairs(key: str, pairs: Pairs):
+    path = os.path.join(_OCR_CACHE_DIR, f"{key}.json")
+    try:
+        os.makedirs(_OCR_CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(pairs, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+        entries = [e for e in os.scandir(_OCR_CACHE_DIR) if e.name.endswith(".json")]
+        if len(entries) > _OCR_CACHE_MAX_FILES:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for e in entries[: len(entries) - _OCR_CACHE_MAX_FILES]:
+                os.unlink(e.path)
+    except Exception as e:
+        warn(f"Could not cache OCR result: {e}")
+
+
+def cached_ocr_pairs(
+    image_path: str, langs, max_side: int, target: str = "auto"
+) -> Optional[Pairs]:
+    """
+    The stored result of an earlier ocr_extract_pairs_multi run on this image
+    with the same languages (in the same order), max_side and target, or
+    None. Needs no engines, so callers check it before init_ocr_engines.
+    """
+    try:
+        key = _ocr_cache_key(image_path, langs, max_side, target)
+    except OSError:
+        return None  # unreadable here; let prepare_image_array report it
+    pairs = _load_cached_pairs(key)
+    if pairs is not None:
+        info(f"OCR cache hit for {image_path} ({len(pairs)} items)")
+    return pairs
+
+
+def ocr_extract_pairs_multi(
+    image_path: str, ocr_engines, max_side: int, target: str = "auto"
+) -> Pairs:
+    """
+    OCR *image_path* with every engine and merge the results. Non-empty
+    results are cached on disk by image content and settings; look them up
+    with cached_ocr_pairs() before initializing engines.
+
+    For auto/vendor targets, the first engine runs alone and the rest are
+    skipped if it already read a high-confidence part-like code. If more
+    than one engine remains, they run concurrently on the shared engine
+    pool: they are separate predictors, and inference releases the GIL.
+    """
+    image = prepare_image_array(image_path, max_side)
+    all_pairs: Pairs = []
+    rest = list(ocr_engines)
+    if len(rest) > 1 and target in ("auto", "vendor"):
+        lang, engine = rest.pop(0)
+        step(f"OCR with lang={lang} on {image_path}")
+        all_pairs.extend(_run_engine_any(engine, image, lang))
+        if _has_strong_code(all_pairs):
+            info(f"[{lang}] confident part code found; skipping remaining languages")
+            rest = []
+
+    for lang, _ in rest:
+        step(f"OCR with lang={lang} on {image_path}")
+    if len(rest) > 1:
+        results = list(
+            _engine_pool().map(lambda le: _run_engine_any(le[1], image, le[0]), rest)
+        )
+    else:
+        results = [_run_engine_any(engine, image, lang) for lang, engine in rest]
+    for engine_pairs in results:
+        all_pairs.extend(engine_pairs)
 
     # Deduplicate by normalized key; keep highest confidence
     merged = {}
     for t, s in all_pairs:
-        key = re.sub(r"[ .-]", "", t).upper()
+        key = t.translate(_DEDUP_SEP_TABLE).upper()
         if not key:
             continue
-        if key not in merged or s > merged[key][1]:
+        best = merged.get(key)
+        if best is None or s > best[1]:
             merged[key] = (t, s)
 
-    pairs = [(orig, conf) for _, (orig, conf) in merged.items()]
+    pairs = list(merged.values())
+    if pairs:
+        try:
+            langs = [lang for lang, _ in ocr_engines]
+            key = _ocr_cache_key(image_path, langs, max_side, target)
+        except OSError:
+            key = None
+        if key:
+            _save_cached_pairs(key, pairs)
     return pairs
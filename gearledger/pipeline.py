@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 from typing import Dict, Any, List, Tuple, Optional
+from operator import itemgetter
+import heapq
 import re
 
 from .logging_utils import step, info, warn, err
@@ -15,7 +17,12 @@ from .config import (
     DEFAULT_VISION_BACKEND,
     OPENAI_VISION_MAX_TOKENS,
 )
-from .excel_utils import try_match_in_excel, find_all_matches_in_excel, ExcelReadError
+from .excel_utils import (
+    try_match_in_excel,
+    try_match_ocr_variants,
+    find_all_matches_in_excel,
+    ExcelReadError,
+)
 from .gpt_utils import (
     get_openai_client,
     rank_with_gpt,
@@ -24,27 +31,53 @@ from .gpt_utils import (
     estimate_cost,
 )
 from .heuristics import (
+    Cand,
+    cand_looks_like_part,
+    cand_score,
     normalize_code,
-    looks_like_part,
-    score_candidate,
     is_oem_like,
     is_vendor_like,
 )
 
 # Optional Paddle imports (used only if backend == "paddle")
 try:
-    from .ocr_utils import init_ocr_engines, ocr_extract_pairs_multi
+    from .ocr_utils import cached_ocr_pairs, init_ocr_engines, ocr_extract_pairs_multi
 except Exception:
+    cached_ocr_pairs = None
     init_ocr_engines = None
     ocr_extract_pairs_multi = None
 
 
 # ---------------------------------------------------------------------------
 
+_WS_RE = re.compile(r"\s+")
+
+# Candidates below this OCR confidence are not worth GPT prompt tokens
+_MIN_PROMPT_CONF = 0.3
+
 
 def _space_norm(s: str) -> str:
     """Uppercase and remove only whitespace (keep hyphens/dots untouched)."""
-    return re.sub(r"\s+", "", s or "").upper()
+    return _WS_RE.sub("", s or "").upper()
+
+
+def _prompt_candidates(filtered, target, top_k):
+    """
+    Trim the filtered pairs to what GPT needs to see: no low-confidence
+    tokens, one spelling per normalized code, and the *top_k* best by
+    local score.
+    """
+    kept = [Cand(t, s) for (t, s) in filtered if s >= _MIN_PROMPT_CONF]
+    if not kept:
+        return filtered[:top_k]
+    best = {}
+    for c in kept:
+        if c.norm not in best or c.conf > best[c.norm].conf:
+            best[c.norm] = c
+    ranked = sorted(
+        best.values(), key=lambda c: (cand_score(c, target), c.conf), reverse=True
+    )
+    return [(c.raw, c.conf) for c in ranked[:top_k]]
 
 
 # ---------------------------------------------------------------------------
@@ -303,22 +336,28 @@ def process_image(
         log(err, "PaddleOCR not available in this environment.")
         return {"ok": False, "error": "ocr_unavailable", "logs": logs}
 
-    engines = init_ocr_engines(langs)
-    if not engines:
-        log(err, "No OCR engines initialized.")
-        return {"ok": False, "error": "ocr_init_failed", "logs": logs}
+    # A cached result needs no engines: check it before loading the models
+    pairs = cached_ocr_pairs(image_path, langs, max_side, target)
+    if pairs is None:
+        engines = init_ocr_engines(langs)
+        if not engines:
+            log(err, "No OCR engines initialized.")
+            return {"ok": False, "error": "ocr_init_failed", "logs": logs}
 
-    pairs = ocr_extract_pairs_multi(image_path, engines, max_side)
+        pairs = ocr_extract_pairs_multi(image_path, engines, max_side, target)
     if not pairs:
         log(err, "No OCR text found.")
         return {"ok": False, "error": "no_ocr", "logs": logs}
 
-    pairs_sorted = sorted(pairs, key=lambda x: x[1], reverse=True)[:max_items]
+    # Top-k without sorting the whole merged list (same order as sorted()[:k])
+    pairs_sorted = heapq.nlargest(max_items, pairs, key=itemgetter(1))
     log(step, f"Merged top {len(pairs_sorted)} texts (raw):")
     for t, s in pairs_sorted:
         logs.append(f"  - {t}  (conf {s:.2f})")
 
-    filtered = [(t, s) for (t, s) in pairs_sorted if looks_like_part(t, target, set())]
+    filtered = [
+        (t, s) for (t, s) in pairs_sorted if cand_looks_like_part(Cand(t, s), target)
+    ]
     log(step, f"Filtered for GPT ({len(filtered)}):")
     for t, s in filtered:
         logs.append(f"  - {t}  (conf {s:.2f})")
@@ -329,7 +368,9 @@ def process_image(
         log(err, "Missing OPENAI_API_KEY.")
         return {"ok": False, "error": "no_api_key", "logs": logs}
 
-    raw, tin, tout = rank_with_gpt(client, model, filtered, target, top_k=top_k)
+    raw, tin, tout = rank_with_gpt(
+        client, model, _prompt_candidates(filtered, target, top_k), target, top_k=top_k
+    )
     gpt_cost = estimate_cost(model, tin, tout)
     if gpt_cost is not None:
         log(info, f"Approx GPT cost: ${gpt_cost:.6f}")
@@ -347,10 +388,12 @@ def process_image(
 
     if not best_norm:
         # Local fallback
-        scored = [(t, s, score_candidate(target, set(), t, s)) for (t, s) in filtered]
-        scored.sort(key=lambda x: (x[2], x[1], len(normalize_code(x[0]))), reverse=True)
-        best_visible = scored[0][0]
-        best_norm = normalize_code(scored[0][0])
+        cands = [Cand(t, s) for (t, s) in filtered]
+        scored = [(cand_score(c, target), c) for c in cands]
+        scored.sort(key=lambda x: (x[0], x[1].conf, len(x[1].norm)), reverse=True)
+        best = scored[0][1]
+        best_visible = best.raw
+        best_norm = best.norm
         reason = "local_scoring_fallback"
 
     log(step, f"BEST (visible): {best_visible}")
@@ -413,47 +456,52 @@ def run_fuzzy_match(
 
     dbg_all: List[str] = []
 
-    for visible, normalized in cand_order or []:
-        if not normalized:
-            continue
-        log(info, f"Fuzzy Excel try: {visible}  (→ {normalized})")
-
-        try:
-            c, a, dbg = try_match_in_excel(excel_path, normalized, min_fuzzy)
-        except ExcelReadError as e:
-            # Return error for UI to show popup
-            # Pass error info as dict (not exception object) for multiprocessing queue
-            return {
-                "ok": False,
-                "error": f"Excel read error: {e.error_message}",
-                "excel_error": {
-                    "excel_path": e.excel_path,
-                    "error_message": e.error_message,
-                },
-                "logs": logs,
-            }
-
-        if dbg:
-            dbg_all.append(dbg)
-
-        if c:
-            log(step, f"FUZZY MATCH → {a}  | Клиент: {c}")
-            logs.append("[FUZZY DEBUG] ------------------")
-            logs.extend(dbg_all)
-            logs.append("---------- end FUZZY DEBUG -----")
-            # Check for ambiguous dash-variant matches (e.g. "713" and "7-1-3" both in catalog)
-            all_matches = find_all_matches_in_excel(excel_path, visible)
-            multi_match = all_matches if len(all_matches) > 1 else []
-            if multi_match:
-                log(step, f"MULTI MATCH — {len(multi_match)} candidates: {[x[1] for x in multi_match]}")
-            return {
-                "ok": True,
-                "match_client": c,
-                "match_artikul": a,
-                "multi_match": multi_match,
-                "logs": logs,
-                "excel_error": None,
-            }
+    # Exact lookups for every candidate first, then OCR look-alike spellings
+    passes = (("exact", try_match_in_excel), ("OCR look-alike", try_match_ocr_variants))
+    for pass_name, matcher in passes:
+        for visible, normalized in cand_order or []:
+            if not normalized:
+                continue
+            log(info, f"Fuzzy Excel try ({pass_name}): {visible}  (→ {normalized})")
+
+            try:
+                c, a, dbg = matcher(excel_path, normalized, min_fuzzy)
+            except ExcelReadError as e:
+                # Return error for UI to show popup
+                # Pass error info as dict (not exception object) for multiprocessing queue
+                return {
+                    "ok": False,
+                    "error": f"Excel read error: {e.error_message}",
+                    "excel_error": {
+                        "excel_path": e.excel_path,
+                        "error_message": e.error_message,
+                    },
+                    "logs": logs,
+                }
+
+            if dbg:
+                dbg_all.append(dbg)
+
+            if c:
+                log(step, f"FUZZY MATCH → {a}  | Клиент: {c}")
+                logs.append("[FUZZY DEBUG] ------------------")
+                logs.extend(dbg_all)
+                logs.append("---------- end FUZZY DEBUG -----")
+                # Check for ambiguous dash-variant matches (e.g. "713" and "7-1-3" both in catalog)
+                all_matches = find_all_matches_in_excel(
+                    excel_path, visible if matcher is try_match_in_excel else a
+                )
+                multi_match = all_matches if len(all_matches) > 1 else []
+                if multi_match:
+                    log(step, f"MULTI MATCH — {len(multi_match)} candidates: {[x[1] for x in multi_match]}")
+                return {
+                    "ok": True,
+                    "match_client": c,
+                    "match_artikul": a,
+                    "multi_match": multi_match,
+                    "logs": logs,
+                    "excel_error": None,
+                }
 
     log(warn, "Fuzzy pass did not find a match.")
     logs.append("[FUZZY DEBUG] ------------------")
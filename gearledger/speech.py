@@ -3,11 +3,16 @@
 import sys
 import subprocess
 import os
+import json
+import platform
+import re
+import shutil
 import tempfile
 import threading
 
 # Don't initialize engine at module level - create it on demand
 _ENGINE_AVAILABLE = None
+_engine_probe_lock = threading.Lock()
 
 # ---------------------------------------------------------------------------
 # Async speech helpers — keeps the UI thread free during TTS playback
@@ -35,17 +40,95 @@ def _run_speech_async(fn, *args, **kwargs):
     t = threading.Thread(target=fn, args=args, kwargs=kwargs, daemon=True)
     t.start()
 
+
+# ---------------------------------------------------------------------------
+# Lazily-resolved settings / Piper hooks — imported once, reused per call
+# ---------------------------------------------------------------------------
+_get_speech_engine = None
+_get_use_openai_tts = None
+_speak_with_piper = None
+_piper_import_reported = False
+
+
+def _current_speech_engine() -> str:
+    """Return the configured speech engine ("os" / "openai" / "piper")."""
+    global _get_speech_engine
+    if _get_speech_engine is None:
+        try:
+            from gearledger.desktop.settings_manager import get_speech_engine
+
+            _get_speech_engine = get_speech_engine
+        except Exception:
+            _get_speech_engine = lambda: "os"
+    try:
+        return _get_speech_engine()
+    except Exception:
+        return "os"
+
+
+def _use_openai_tts() -> bool:
+    """Return the 'use OpenAI TTS' setting (False if settings are unavailable)."""
+    global _get_use_openai_tts
+    if _get_use_openai_tts is None:
+        try:
+            from gearledger.desktop.settings_manager import get_use_openai_tts
+
+            _get_use_openai_tts = get_use_openai_tts
+        except Exception:
+            _get_use_openai_tts = lambda: False
+    try:
+        return bool(_get_use_openai_tts())
+    except Exception:
+        return False
+
+
+def _resolve_speak_with_piper():
+    """
+    Return piper_tts.speak_with_piper, or None if Piper can't be imported.
+    Only a successful import is cached, so Piper is picked up once it's
+    installed; the failure is reported once per process.
+    """
+    global _speak_with_piper, _piper_import_reported
+    if _speak_with_piper is None:
+        try:
+            from gearledger.piper_tts import speak_with_piper
+
+            _speak_with_piper = speak_with_piper
+        except Exception as e:
+            if not _piper_import_reported:
+                _piper_import_reported = True
+                print(f"[SPEECH] Piper TTS unavailable: {e}")
+    return _speak_with_piper
+
+
 # Current speech language (synced with app language)
 _SPEECH_LANGUAGE = "en"
 
+# OpenAI TTS for speak_name (engine=openai): model tried first (older
+# tts-1-hd / tts-1 follow), and the voice per detected name language
+_OPENAI_TTS_MODEL = "gpt-4o-mini-tts"
+_OPENAI_VOICES = {"en": "alloy", "ru": "nova"}
+
 # Preferred macOS voices (in order of preference)
 _MACOS_VOICE_PREFERENCES = {
     "en": ["Samantha", "Alex", "Victoria", "Karen", "Daniel"],
     "ru": ["Milena", "Yuri", "Katya", "Anna"],
 }
 
-# Cache for available voices (detected at runtime)
+# Language hints used when no preferred voice is installed (one regex per
+# language, so each voice name is scanned once)
+_MACOS_VOICE_HINT_RES = {
+    "en": re.compile(r"en|english|us"),
+    "ru": re.compile(r"ru|russian"),
+}
+
+# Cache for available voices (detected at runtime, persisted per macOS version)
 _AVAILABLE_MACOS_VOICES = None
+_MACOS_VOICES_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".gearledger", "cache", "macos_voices.json"
+)
+# (voices list, name set, lowercased names) derived from the cache above
+_MACOS_VOICE_INDEX = None
 
 
 def set_speech_language(lang: str):
@@ -59,6 +142,32 @@ def get_speech_language() -> str:
     return _SPEECH_LANGUAGE
 
 
+def _load_cached_macos_voices(os_version: str) -> list[str]:
+    """Return the on-disk voice list if it was saved for *os_version*."""
+    if not os_version:
+        return []
+    try:
+        with open(_MACOS_VOICES_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == os_version and isinstance(data.get("voices"), list):
+            return [str(v) for v in data["voices"]]
+    except Exception:
+        pass
+    return []
+
+
+def _save_cached_macos_voices(os_version: str, voices: list[str]):
+    """Persist the parsed voice list for the next process start."""
+    if not os_version or not voices:
+        return
+    try:
+        os.makedirs(os.path.dirname(_MACOS_VOICES_CACHE_PATH), exist_ok=True)
+        with open(_MACOS_VOICES_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"version": os_version, "voices": voices}, f)
+    except Exception as e:
+        print(f"[SPEECH] Failed to cache macOS voices: {e}")
+
+
 def _list_macos_voices() -> list[str]:
     """List all available macOS voices by querying the system."""
     global _AVAILABLE_MACOS_VOICES
@@ -69,6 +178,14 @@ def _list_macos_voices() -> list[str]:
         _AVAILABLE_MACOS_VOICES = []
         return []
 
+    # Voices only change with OS updates — reuse the list saved by a
+    # previous run for the same macOS version instead of running `say`.
+    os_version = platform.mac_ver()[0]
+    voices = _load_cached_macos_voices(os_version)
+    if voices:
+        _AVAILABLE_MACOS_VOICES = voices
+        return voices
+
     try:
         result = subprocess.run(
             ["say", "-v", "?"], capture_output=True, text=True, timeout=5
@@ -85,6 +202,7 @@ def _list_macos_voices() -> list[str]:
                         voice_name = parts[0]
                         voices.append(voice_name)
             _AVAILABLE_MACOS_VOICES = voices
+            _save_cached_macos_voices(os_version, voices)
             return voices
     except Exception as e:
         print(f"[SPEECH] Failed to list macOS voices: {e}")
@@ -93,6 +211,18 @@ def _list_macos_voices() -> list[str]:
     return []
 
 
+def _macos_voice_index(available: list[str]) -> tuple[set, list[str]]:
+    """Return (name set, lowercased names) for *available*, cached per list."""
+    global _MACOS_VOICE_INDEX
+    if _MACOS_VOICE_INDEX is None or _MACOS_VOICE_INDEX[0] is not available:
+        _MACOS_VOICE_INDEX = (
+            available,
+            set(available),
+            [v.lower() for v in available],
+        )
+    return _MACOS_VOICE_INDEX[1], _MACOS_VOICE_INDEX[2]
+
+
 def _pick_macos_voice(lang: str) -> str:
     """
     Pick the best available macOS voice for the given language.
@@ -102,26 +232,48 @@ def _pick_macos_voice(lang: str) -> str:
     if not available:
         return "Samantha"  # Default fallback
 
+    voice_set, voices_lower = _macos_voice_index(available)
     preferences = _MACOS_VOICE_PREFERENCES.get(lang, _MACOS_VOICE_PREFERENCES["en"])
 
     # Find first preferred voice that exists
     for preferred in preferences:
-        if preferred in available:
+        if preferred in voice_set:
             return preferred
 
     # If no preferred voice found, try to find any voice with language hint
-    lang_hints = {"en": ["en", "english", "us"], "ru": ["ru", "russian"]}
-    hints = lang_hints.get(lang, lang_hints["en"])
-
-    for voice in available:
-        voice_lower = voice.lower()
-        if any(hint in voice_lower for hint in hints):
+    hint_re = _MACOS_VOICE_HINT_RES.get(lang, _MACOS_VOICE_HINT_RES["en"])
+    for voice, voice_lower in zip(available, voices_lower):
+        if hint_re.search(voice_lower):
             return voice
 
     # Final fallback: return first available or default
     return available[0] if available else "Samantha"
 
 
+def _score_voice(voice, lang: str) -> int:
+    """
+    Rank a pyttsx3 voice for *lang*: 0 = no match, 2 = language match,
+    3 = premium/neural Russian voice (better quality).
+    """
+    voice_id = voice.id.lower()
+    voice_name = voice.name.lower() if voice.name else ""
+
+    if lang == "ru":
+        if not (
+            "ru" in voice_id
+            or "russian" in voice_id
+            or "milena" in voice_name
+            or "yuri" in voice_name
+        ):
+            return 0
+        if "premium" in voice_name or "neural" in voice_name:
+            return 3
+        return 2
+    if lang == "en":
+        return 2 if ("en" in voice_id or "english" in voice_id) else 0
+    return 0
+
+
 def _get_engine():
     """Get or create a pyttsx3 engine instance."""
     global _ENGINE_AVAILABLE
@@ -129,14 +281,17 @@ def _get_engine():
         import pyttsx3
 
         if _ENGINE_AVAILABLE is None:
-            # Check if pyttsx3 is available
-            try:
-                test_engine = pyttsx3.init()
-                test_engine.stop()  # Clean up test engine
-                _ENGINE_AVAILABLE = True
-            except Exception:
-                _ENGINE_AVAILABLE = False
-                return None
+            # Check if pyttsx3 is available (locked: warmup_speech() may be
+            # probing on another thread)
+            with _engine_probe_lock:
+                if _ENGINE_AVAILABLE is None:
+                    try:
+                        test_engine = pyttsx3.init()
+                        test_engine.stop()  # Clean up test engine
+                        _ENGINE_AVAILABLE = True
+                    except Exception:
+                        _ENGINE_AVAILABLE = False
+                        return None
 
         if _ENGINE_AVAILABLE:
             # Create a new engine instance each time to avoid issues
@@ -147,43 +302,17 @@ def _get_engine():
                 voices = engine.getProperty("voices")
                 target_lang = _SPEECH_LANGUAGE
 
-                # Prefer premium/neural voices for better quality
-                voice_found = False
+                # Single ranked scan: language match = 2, premium/neural RU
+                # voice = 3. First voice with the highest score wins.
+                best_score, best_id = 0, None
                 for voice in voices:
-                    voice_id = voice.id.lower()
-                    voice_name = voice.name.lower() if voice.name else ""
-
-                    # Check for Russian voice
-                    if target_lang == "ru":
-                        if ("premium" in voice_name or "neural" in voice_name) and (
-                            "ru" in voice_id
-                            or "russian" in voice_id
-                            or "milena" in voice_name
-                            or "yuri" in voice_name
-                        ):
-                            engine.setProperty("voice", voice.id)
-                            voice_found = True
+                    score = _score_voice(voice, target_lang)
+                    if score > best_score:
+                        best_score, best_id = score, voice.id
+                        if score == 3:
                             break
-
-                # If premium not found, try regular voices
-                if not voice_found:
-                    for voice in voices:
-                        voice_id = voice.id.lower()
-                        voice_name = voice.name.lower() if voice.name else ""
-
-                        if target_lang == "ru":
-                            if (
-                                "ru" in voice_id
-                                or "russian" in voice_id
-                                or "milena" in voice_name
-                                or "yuri" in voice_name
-                            ):
-                                engine.setProperty("voice", voice.id)
-                                break
-                        elif target_lang == "en":
-                            if "en" in voice_id or "english" in voice_id:
-                                engine.setProperty("voice", voice.id)
-                                break
+                if best_id:
+                    engine.setProperty("voice", best_id)
 
                 # Adjust rate and pitch for more natural sound
                 try:
@@ -202,6 +331,11 @@ def _get_engine():
     return None
 
 
+# Cyrillic range: U+0400-U+04FF / ASCII Latin letters (A-Z, a-z)
+_CYRILLIC_RE = re.compile(r"[\u0400-\u04ff]")
+_LATIN_RE = re.compile(r"[A-Za-z]")
+
+
 def _detect_name_language(name: str) -> str:
     """
     Detect if a name is mostly Cyrillic (RU) or Latin (EN).
@@ -210,21 +344,21 @@ def _detect_name_language(name: str) -> str:
     if not name:
         return "en"
 
-    cyrillic_count = 0
-    latin_count = 0
-
-    for char in name:
-        # Cyrillic range: U+0400-U+04FF
-        if "\u0400" <= char <= "\u04ff":
-            cyrillic_count += 1
-        # Latin letters (A-Z, a-z)
-        elif char.isalpha() and ord(char) < 128:
-            latin_count += 1
+    # Count in C via the regex engine rather than a per-char Python loop
+    cyrillic_count = len(_CYRILLIC_RE.findall(name))
+    latin_count = len(_LATIN_RE.findall(name))
 
     # If more Cyrillic than Latin, treat as Russian
     return "ru" if cyrillic_count > latin_count else "en"
 
 
+# Arrow variants spoken as "to" / "клиент"
+_ARROW_RE = re.compile(r"->|[→⇒➜]")
+# Whitespace that " ".join(text.split()) would change: runs of 2+ or any
+# non-space whitespace (tabs, newlines, NBSP ...)
+_MESSY_WS_RE = re.compile(r"\s{2,}|[^\S ]")
+
+
 def _clean_text_for_speech(text: str) -> str:
     """
     Clean and format text for better TTS pronunciation.
@@ -236,42 +370,41 @@ def _clean_text_for_speech(text: str) -> str:
         return ""
 
     # Replace various arrow types (language-aware)
-    arrows = ["→", "→", "->", "⇒", "➜", "→"]
-    replacement = " to " if _SPEECH_LANGUAGE == "en" else " клиент "
-    for arrow in arrows:
-        text = text.replace(arrow, replacement)
+    if _ARROW_RE.search(text):
+        replacement = " to " if _SPEECH_LANGUAGE == "en" else " клиент "
+        text = _ARROW_RE.sub(replacement, text)
 
-    # Clean up extra spaces
-    text = " ".join(text.split())
+    # Clean up extra spaces (already-clean text, e.g. most client names,
+    # is returned as-is without re-splitting)
+    if text != text.strip() or _MESSY_WS_RE.search(text):
+        text = " ".join(text.split())
 
-    return text.strip()
+    return text
 
 
-def speak(text: str):
-    """Non-blocking: schedules speech on a background thread."""
+def speak(text: str, _clean: bool = True):
+    """
+    Non-blocking: schedules speech on a background thread.
+    Internal callers that already cleaned *text* pass _clean=False.
+    """
     if not text:
         return
-    _run_speech_async(_speak_sync, text)
+    _run_speech_async(_speak_sync, text, _clean)
 
 
-def _speak_sync(text: str):
+def _speak_sync(text: str, _clean: bool = True):
     # Clean text for better speech
-    text = _clean_text_for_speech(text)
+    if _clean:
+        text = _clean_text_for_speech(text)
 
     # Determine speech engine
-    try:
-        from gearledger.desktop.settings_manager import get_speech_engine
-
-        engine = get_speech_engine()
-    except Exception:
-        engine = "os"
+    engine = _current_speech_engine()
 
     # Piper engine (local, offline)
     if engine == "piper":
+        speak_with_piper = _resolve_speak_with_piper()
         try:
-            from gearledger.piper_tts import speak_with_piper
-
-            if speak_with_piper(text):
+            if speak_with_piper is not None and speak_with_piper(text):
                 return
         except Exception as e:
             print(f"[SPEECH] Piper TTS failed, falling back to OS TTS: {e}")
@@ -321,12 +454,7 @@ def speak_no_match(scenario: str = "plain", code: str = None):
 
 
 def _speak_no_match_sync(scenario: str = "plain", code: str = None):
-    try:
-        from gearledger.desktop.settings_manager import get_speech_engine
-
-        engine = get_speech_engine()
-    except Exception:
-        engine = "os"
+    engine = _current_speech_engine()
 
     if engine == "piper":
         if scenario == "plain":
@@ -337,10 +465,9 @@ def _speak_no_match_sync(scenario: str = "plain", code: str = None):
             text = _SPEAK_NO_MATCH_ARMENIAN["for_code"].format(code=code)
         else:
             text = _SPEAK_NO_MATCH_ARMENIAN["plain"]
+        speak_with_piper = _resolve_speak_with_piper()
         try:
-            from gearledger.piper_tts import speak_with_piper
-
-            if speak_with_piper(text):
+            if speak_with_piper is not None and speak_with_piper(text):
                 return
         except Exception as e:
             print(f"[SPEECH] Piper TTS failed for no_match: {e}")
@@ -399,6 +526,18 @@ _MATCH_MESSAGES = {
     },
 }
 
+# Precomputed "<match found>. <code>:" intros so speak_match doesn't rebuild
+# them on every announcement
+_MATCH_INTROS = {
+    lang: f"{m['match_found']}. {m['code']}:" for lang, m in _MATCH_MESSAGES.items()
+}
+
+# Weight phrases for speak_match ({} = formatted weight)
+_WEIGHT_TEMPLATES = {
+    "en": "Weight: {} kilograms",
+    "ru": "Вес: {} килограмм",
+}
+
 
 def _spell_code(code: str) -> str:
     """
@@ -501,17 +640,13 @@ def speak_match(artikul: str, client: str, weight: float = None):
 
 
 def _speak_match_sync(artikul: str, client: str, weight: float = None):
-    msgs = _MATCH_MESSAGES.get(_SPEECH_LANGUAGE, _MATCH_MESSAGES["en"])
+    intro = _MATCH_INTROS.get(_SPEECH_LANGUAGE, _MATCH_INTROS["en"])
+    weight_tpl = _WEIGHT_TEMPLATES.get(_SPEECH_LANGUAGE, _WEIGHT_TEMPLATES["en"])
     code_spelled = _spell_code(artikul)
     client_clean = _clean_text_for_speech(client) if client else None
 
     # If Piper engine is selected, speak a simple Armenian sentence with the client name.
-    try:
-        from gearledger.desktop.settings_manager import get_speech_engine
-
-        engine = get_speech_engine()
-    except Exception:
-        engine = "os"
+    engine = _current_speech_engine()
 
     # Debug log for engine used in speak_match
     try:
@@ -523,10 +658,7 @@ def _speak_match_sync(artikul: str, client: str, weight: float = None):
         pass
 
     if engine == "piper":
-        try:
-            from gearledger.piper_tts import speak_with_piper
-        except Exception:
-            speak_with_piper = None
+        speak_with_piper = _resolve_speak_with_piper()
 
         if speak_with_piper is not None and client_clean:
             # Keep it short and name-focused; artikul/weight are not spoken here.
@@ -540,19 +672,13 @@ def _speak_match_sync(artikul: str, client: str, weight: float = None):
     # macOS: Use split-speaking for better quality (RU + EN parts) for OS/OpenAI engines
     if sys.platform == "darwin":
         # Check if we should use OpenAI (if enabled)
-        try:
-            from gearledger.desktop.settings_manager import get_use_openai_tts
-
-            use_openai = get_use_openai_tts() and os.environ.get("OPENAI_API_KEY")
-        except Exception:
-            use_openai = False
+        use_openai = _use_openai_tts() and os.environ.get("OPENAI_API_KEY")
 
         if not use_openai:
             # Split-speaking: RU parts with RU voice, EN code/name with EN voice
             if _SPEECH_LANGUAGE == "ru":
                 # Part 1: RU intro
-                ru_intro = f"{msgs['match_found']}. {msgs['code']}:"
-                _speak_macos(ru_intro, "ru", wait=True)
+                _speak_macos(intro, "ru", wait=True)
 
                 # Part 2: Code (spell with EN voice for clarity)
                 _speak_macos(code_spelled, "en", wait=True)
@@ -560,7 +686,7 @@ def _speak_match_sync(artikul: str, client: str, weight: float = None):
                 # Part 3: Weight (if provided)
                 if weight is not None and weight > 0:
                     weight_formatted = _format_weight_for_speech(weight)
-                    ru_weight = f". Вес: {weight_formatted} килограмм"
+                    ru_weight = ". " + weight_tpl.format(weight_formatted)
                     _speak_macos(ru_weight, "ru", wait=True)
 
                 # Part 4: Client (with EN voice for names, no prefix)
@@ -574,20 +700,17 @@ def _speak_match_sync(artikul: str, client: str, weight: float = None):
             # EN: Single voice is fine, continue to default path
 
     # Default: Single voice (Windows, Linux, or EN on macOS)
-    parts = [f"{msgs['match_found']}", f"{msgs['code']}: {code_spelled}"]
+    parts = [f"{intro} {code_spelled}"]
 
     if weight is not None and weight > 0:
-        weight_formatted = _format_weight_for_speech(weight)
-        if _SPEECH_LANGUAGE == "ru":
-            parts.append(f"Вес: {weight_formatted} килограмм")
-        else:
-            parts.append(f"Weight: {weight_formatted} kilograms")
+        parts.append(weight_tpl.format(_format_weight_for_speech(weight)))
 
     if client_clean:
         parts.append(client_clean)
 
+    # Parts are already speech-clean (spelled code + cleaned client name)
     message = ". ".join(parts) + "."
-    _speak_sync(message)
+    _speak_sync(message, _clean=False)
 
 
 def _get_engine_for_language(lang: str):
@@ -631,6 +754,55 @@ def _get_engine_for_language(lang: str):
     return engine
 
 
+def _play_audio_via_stdin(response) -> bool:
+    """
+    Stream TTS audio bytes into ffplay's stdin (afplay can't read a pipe).
+    Returns False only if ffplay isn't installed or can't be started, so the
+    caller can fall back to the temp-file players. Once ffplay is running
+    the clip counts as handled even if it is stopped early (the next speech
+    terminates it) or exits nonzero: the response stream is consumed by
+    then, and replaying it would talk over the new speech.
+    """
+    global _current_say_proc
+    player = shutil.which("ffplay")
+    if not player:
+        return False
+
+    try:
+        proc = subprocess.Popen(
+            [player, "-nodisp", "-autoexit", "-loglevel", "quiet", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except Exception:
+        return False
+
+    with _speech_lock:
+        _current_say_proc = proc
+    try:
+        if hasattr(response, "iter_bytes"):
+            chunks = response.iter_bytes()
+        else:
+            chunks = [response.content]
+        for chunk in chunks:
+            proc.stdin.write(chunk)
+        proc.stdin.close()
+        proc.wait(timeout=30)
+    except Exception as e:
+        if not isinstance(e, BrokenPipeError):  # broken pipe: stopped by next speech
+            print(f"[SPEECH] Streaming playback ended early: {e}")
+        try:
+            proc.kill()
+        except Exception:
+            pass
+    finally:
+        with _speech_lock:
+            if _current_say_proc is proc:
+                _current_say_proc = None
+    return True
+
+
 def speak_name(name: str) -> None:
     """Non-blocking: schedules name speech on a background thread."""
     if not name or not name.strip():
@@ -650,19 +822,13 @@ def _speak_name_sync(name: str) -> None:
     detected_lang = _detect_name_language(cleaned_name)
 
     # Determine preferred speech engine (os / openai / piper)
-    try:
-        from gearledger.desktop.settings_manager import get_speech_engine
-
-        engine = get_speech_engine()
-    except Exception:
-        engine = "os"
+    engine = _current_speech_engine()
 
     # 1) Piper (offline, local) – preferred when explicitly selected
     if engine == "piper":
+        speak_with_piper = _resolve_speak_with_piper()
         try:
-            from gearledger.piper_tts import speak_with_piper
-
-            if speak_with_piper(cleaned_name):
+            if speak_with_piper is not None and speak_with_piper(cleaned_name):
                 return
         except Exception as e:
             print(f"[SPEECH] Piper TTS failed for name, falling back: {e}")
@@ -709,6 +875,11 @@ def _speak_name_sync(name: str) -> None:
                         raise
 
             if response:
+                # Pipe the audio straight into ffplay when it's installed —
+                # no temp file write, no cleanup thread.
+                if sys.platform != "win32" and _play_audio_via_stdin(response):
+                    return
+
                 # Save to temporary file
                 suffix = ".wav" if audio_format == "wav" else ".mp3"
                 with tempfile.NamedTemporaryFile(
@@ -724,7 +895,8 @@ def _speak_name_sync(name: str) -> None:
                         ["afplay", tmp_path],
                         check=False,
                         timeout=30,
-                        capture_output=True,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
                     )
                     playback_done = result.returncode == 0
                 elif sys.platform == "win32":
@@ -799,6 +971,35 @@ def _speak_name_sync(name: str) -> None:
     print(f"[SPEAK NAME] {cleaned_name}")
 
 
+def warmup_speech():
+    """
+    Pre-load the OS TTS backend on a daemon thread so the first announcement
+    doesn't pay start-up latency (pyttsx3/SAPI5 init, or `say` + voice list
+    on macOS). Returns immediately; safe to call more than once.
+    """
+    threading.Thread(target=_warmup_speech_sync, daemon=True).start()
+
+
+def _warmup_speech_sync():
+    try:
+        if sys.platform == "darwin":
+            _list_macos_voices()
+            # Prime the `say` binary and speech framework with a silent run
+            subprocess.run(
+                ["say", ""],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+            )
+        else:
+            engine = _get_engine()
+            if engine:
+                engine.stop()
+    except Exception as e:
+        print(f"[SPEECH] Warmup failed: {e}")
+
+
 def demo_speak_name():
     """Demo function to test speak_name() with different name types."""
     print("Testing speak_name() with Latin name...")
@@ -7,18 +7,104 @@ This script installs all packages from requirements.txt, including:
 - Excel file support (openpyxl, xlrd, pyexcel for repair)
 - Build tools (optional)
 
+Packages that are already installed at a satisfying version are skipped,
+so re-running the script is near-instant.
+
 Usage:
     python install_dependencies.py
+    python install_dependencies.py --build-wheels   # download wheels/ once
+    python install_dependencies.py --offline        # install from wheels/ only
 """
 
 import sys
 import subprocess
 import os
+import shutil
 from pathlib import Path
+from importlib.metadata import version, PackageNotFoundError
+
+try:
+    from packaging.requirements import Requirement
+except ImportError:  # pip always vendors packaging
+    try:
+        from pip._vendor.packaging.requirements import Requirement
+    except ImportError:
+        Requirement = None
+
+# Extra pip flags that skip prompts/version checks and avoid source builds
+PIP_FLAGS = ["--no-input", "--disable-pip-version-check", "--prefer-binary"]
+
+# Local wheelhouse for offline/deterministic installs (see build_wheels)
+WHEELS_DIR = Path(__file__).parent.absolute() / "wheels"
+
+
+def build_wheels(requirements_file):
+    """Download wheels for every requirement into WHEELS_DIR (run once, online)."""
+    WHEELS_DIR.mkdir(exist_ok=True)
+    print(f"📥 Downloading wheels into: {WHEELS_DIR}")
+    subprocess.check_call(
+        [sys.executable, "-m", "pip", "download", *PIP_FLAGS]
+        + ["-d", str(WHEELS_DIR), "-r", str(requirements_file)]
+    )
+    print(
+        "✅ Wheels downloaded. Install with: python install_dependencies.py --offline"
+    )
+
+
+def install_command(packages, pip_source):
+    """
+    Command that installs *packages* into this interpreter.
+    Uses uv (Rust resolver, parallel downloads) when it is on PATH,
+    otherwise pip in a subprocess.
+    """
+    uv = shutil.which("uv")
+    if uv:
+        return [uv, "pip", "install", "--python", sys.executable, "--upgrade"] + (
+            [*pip_source, *packages]
+        )
+    return [sys.executable, "-m", "pip", "install", "--upgrade", *PIP_FLAGS] + (
+        [*pip_source, *packages]
+    )
 
 
-def main():
+def read_requirements(requirements_file):
+    """Return requirement strings from requirements.txt (comments stripped)."""
+    reqs = []
+    for line in Path(requirements_file).read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            reqs.append(line)
+    return reqs
+
+
+def needs_install(req_line):
+    """True if the requirement is missing or its installed version misses the pin."""
+    if Requirement is None:
+        name = req_line.split(";")[0]
+        for sep in ("[", "=", ">", "<", "~", "!"):
+            name = name.split(sep)[0]
+        try:
+            version(name.strip())
+            return False
+        except PackageNotFoundError:
+            return True
+
+    req = Requirement(req_line)
+    if req.marker is not None and not req.marker.evaluate():
+        return False  # not for this platform/Python
+    try:
+        installed = version(req.name)
+    except PackageNotFoundError:
+        return True
+    return bool(req.specifier) and not req.specifier.contains(
+        installed, prereleases=True
+    )
+
+
+def main(argv=None):
     """Install all required dependencies from requirements.txt."""
+    argv = sys.argv[1:] if argv is None else argv
+    offline = "--offline" in argv
     print("=" * 60)
     print("📦 Installing GearLedger Dependencies")
     print("=" * 60)
@@ -33,6 +119,23 @@ def main():
         print(f"   Expected at: {requirements_file}")
         sys.exit(1)
 
+    if "--build-wheels" in argv:
+        try:
+            build_wheels(requirements_file)
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Wheel download failed with error code: {e.returncode}")
+            sys.exit(1)
+        return
+
+    pip_source = []
+    if offline:
+        if not WHEELS_DIR.is_dir():
+            print("❌ wheels/ not found - run with --build-wheels first.")
+            print(f"   Expected at: {WHEELS_DIR}")
+            sys.exit(1)
+        pip_source = ["--no-index", "--find-links", str(WHEELS_DIR)]
+        print(f"📦 Offline mode: installing from {WHEELS_DIR}")
+
     print(f"📄 Installing from: {requirements_file}")
     print()
     print("📦 This will install:")
@@ -42,7 +145,6 @@ def main():
     print("   • Data processing (pandas, numpy)")
     print("   • Image processing (Pillow)")
     print("   • Camera & Scale (opencv-python, pyserial)")
-    print("   • Fuzzy matching (fuzzywuzzy, Levenshtein)")
     print("   • OpenAI API support")
     print("   • Text-to-speech (pyttsx3)")
     print("   • Network/Server (Flask, requests) - for multi-device mode")
@@ -51,19 +153,19 @@ def main():
     print()
 
     try:
-        # Install all packages from requirements.txt
-        print("🔨 Installing packages...")
-        subprocess.check_call(
-            [
-                sys.executable,
-                "-m",
-                "pip",
-                "install",
-                "--upgrade",
-                "-r",
-                str(requirements_file),
-            ]
-        )
+        # Only hand pip the packages that are missing or outdated
+        to_install = [
+            r for r in read_requirements(requirements_file) if needs_install(r)
+        ]
+        if not to_install:
+            print("✅ All packages already installed - nothing to do.")
+            return
+
+        print(f"🔨 Installing {len(to_install)} package(s): {', '.join(to_install)}")
+        cmd = install_command(to_install, pip_source)
+        if cmd[0] != sys.executable:
+            print("⚡ Using uv for a faster install")
+        subprocess.check_call(cmd)
 
         print()
         print("=" * 60)
@@ -76,7 +178,6 @@ def main():
         print("   • Excel support (openpyxl, xlrd, pyexcel)")
         print("   • Data processing (pandas, numpy)")
         print("   • Camera & Scale (opencv-python, pyserial)")
-        print("   • Fuzzy matching (fuzzywuzzy, Levenshtein)")
         print("   • OpenAI API support")
         print("   • Network/Server (Flask, requests)")
         print()
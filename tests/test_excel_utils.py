@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+from gearledger import excel_utils
+
+
+def test_lookalike_variants_fewest_swaps_first():
+    variants = excel_utils._ocr_lookalike_variants("OB1S5081")
+
+    # A swap at the very first position is tried, not cut off by the cap
+    assert variants[0] == "0B1S5081"
+    assert "OB1S5081" not in variants
+
+    # All 8 single swaps come before any double swap
+    swaps = [sum(a != b for a, b in zip(v, "OB1S5081")) for v in variants]
+    assert swaps[:9] == [1] * 8 + [2]
+    assert swaps == sorted(swaps)
+    assert len(variants) == excel_utils._OCR_VARIANTS_MAX
+    assert len(set(variants)) == len(variants)
+
+
+def test_lookalike_variants_without_ambiguous_chars():
+    assert excel_utils._ocr_lookalike_variants("PK-7236") == []
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+from gearledger import gpt_utils
+
+
+def test_json_helpers_without_orjson(monkeypatch):
+    monkeypatch.setattr(gpt_utils, "orjson", None)
+
+    answer = '```json\n{"best":"PK-5396","normalized":"PK5396","reason":"ok"}\n```'
+    assert gpt_utils.parse_compact_json(answer)["normalized"] == "PK5396"
+
+    payload = gpt_utils._json_loads(gpt_utils._json_dumps({"t": "Деталь", "c": 0.5}))
+    assert payload == {"t": "Деталь", "c": 0.5}
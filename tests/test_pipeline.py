@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+from gearledger import pipeline
+
+
+def test_fuzzy_match_tries_exact_before_lookalikes(monkeypatch):
+    calls = []
+
+    def exact(excel_path, query, *_args):
+        calls.append(("exact", query))
+        return (None, None, "")
+
+    def lookalike(excel_path, query, *_args):
+        calls.append(("lookalike", query))
+        return ("Client", "0B-15", "")
+
+    monkeypatch.setattr(pipeline, "try_match_in_excel", exact)
+    monkeypatch.setattr(pipeline, "try_match_ocr_variants", lookalike)
+    monkeypatch.setattr(pipeline, "find_all_matches_in_excel", lambda *_a: [])
+
+    res = pipeline.run_fuzzy_match("catalog.xlsx", [("OB-15", "OB15"), ("X9", "X9")])
+
+    assert res["ok"] and res["match_artikul"] == "0B-15"
+    assert calls == [("exact", "OB15"), ("exact", "X9"), ("lookalike", "OB15")]
+
+
+def test_ocr_cache_hit_skips_engine_init(monkeypatch):
+    lookups = []
+
+    def cached(image_path, langs, max_side, target):
+        lookups.append(list(langs))
+        return [("PK-5396", 0.97)]
+
+    def no_init(langs):
+        raise AssertionError("engines initialized despite a cache hit")
+
+    monkeypatch.setattr(pipeline, "DEFAULT_VISION_BACKEND", "paddle")
+    monkeypatch.setattr(pipeline, "cached_ocr_pairs", cached, raising=False)
+    monkeypatch.setattr(pipeline, "init_ocr_engines", no_init, raising=False)
+    monkeypatch.setattr(pipeline, "ocr_extract_pairs_multi", no_init, raising=False)
+
+    res = pipeline.process_image(
+        "part.jpg", "catalog.xlsx", langs=["ru", "en"], api_key=None
+    )
+
+    # Reached the GPT step on cached pairs; the requested order is kept
+    assert res["error"] == "no_api_key"
+    assert lookups == [["ru", "en"]]